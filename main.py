@@ -1,15 +1,21 @@
+import asyncio
 import sys
 import logging
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.responses import JSONResponse
 from alembic import command
 from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, text
 from slowapi.errors import RateLimitExceeded
 
 from src.api import auth, contacts, users, utils
-from src.services.limiter import limiter
+from src.conf.config import settings
+from src.services.email import EMAIL_DRAIN_TIMEOUT, email_queue, email_worker
 from src.services.redis_cache import redis_cache
 
 # -------------------- Налаштування логування --------------------
@@ -17,22 +23,80 @@ from src.services.redis_cache import redis_cache
 def configure_logging():
     """
     Конфігурує логування для всієї програми.
+
+    Рівень задається змінною LOG_LEVEL (за замовчуванням INFO).
     """
+    level = settings.LOG_LEVEL.upper()
     logging.basicConfig(
-        level=logging.DEBUG,
+        level=level,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         handlers=[logging.StreamHandler(sys.stdout)],
     )
-    logging.getLogger("uvicorn").setLevel(logging.DEBUG)
-    logging.getLogger("uvicorn.access").setLevel(logging.DEBUG)
-    logging.getLogger("fastapi.middleware").setLevel(logging.DEBUG)
+    logging.getLogger("uvicorn").setLevel(level)
+    logging.getLogger("uvicorn.access").setLevel(level)
+    logging.getLogger("fastapi.middleware").setLevel(level)
 
 configure_logging()
 
+# -------------------- Життєвий цикл застосунку --------------------
+
+# Ключ advisory-блокування Postgres, що серіалізує міграції між воркерами
+MIGRATION_LOCK_ID = 7_243_001
+
+def run_migrations():
+    """
+    Запускає міграції бази даних, якщо схема відстає від head.
+
+    Поточна ревізія БД порівнюється з head скриптів Alembic, тому
+    при актуальній схемі upgrade не виконується. Upgrade виконується
+    під pg_advisory_lock, тож з кількох воркерів міграції запускає
+    лише перший, а решта після очікування бачать актуальну ревізію.
+    """
+    config = Config("alembic.ini")
+    head = ScriptDirectory.from_config(config).get_current_head()
+
+    engine = create_engine(settings.database_url)
+    try:
+        with engine.connect() as connection:
+            if MigrationContext.configure(connection).get_current_revision() == head:
+                logging.info(f"Database is up to date (revision {head})")
+                return
+
+            connection.execute(text("SELECT pg_advisory_lock(:id)"), {"id": MIGRATION_LOCK_ID})
+            try:
+                # Інший воркер міг завершити міграції, поки ми чекали блокування
+                connection.commit()
+                current = MigrationContext.configure(connection).get_current_revision()
+                if current != head:
+                    command.upgrade(config, "head")
+            finally:
+                connection.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": MIGRATION_LOCK_ID})
+                connection.commit()
+    finally:
+        engine.dispose()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Життєвий цикл застосунку: запускаємо міграції, підключаємо Redis
+    та запускаємо обробник черги листів.
+    """
+    await asyncio.to_thread(run_migrations)
+    await redis_cache.connect()
+    worker = asyncio.create_task(email_worker(email_queue))
+    yield
+    # Даємо воркеру дослати листи, що залишились у черзі
+    try:
+        await asyncio.wait_for(email_queue.join(), timeout=EMAIL_DRAIN_TIMEOUT)
+    except asyncio.TimeoutError:
+        logging.warning(f"{email_queue.qsize()} queued emails dropped on shutdown")
+    worker.cancel()
+    with suppress(asyncio.CancelledError):
+        await worker
+
 # -------------------- Ініціалізація FastAPI --------------------
 
-app = FastAPI()
-app.state.limiter = limiter  # Додаємо об'єкт лімітеру до стану застосунку
+app = FastAPI(lifespan=lifespan)
 
 # -------------------- Middleware CORS --------------------
 
@@ -63,26 +127,16 @@ async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
 for router in (auth.router, users.router, contacts.router, utils.router):
     app.include_router(router, prefix="/api")
 
-# -------------------- Події запуску --------------------
-
-async def run_migrations():
-    """
-    Запускає міграції бази даних при старті застосунку.
-    """
-    config = Config("alembic.ini")
-    command.upgrade(config, "head")
-
-@app.on_event("startup")
-async def on_startup():
-    """
-    Подія при запуску застосунку: запускаємо міграції та підключаємо Redis.
-    """
-    await run_migrations()
-    await redis_cache.connect()
-
 # -------------------- Точка входу --------------------
 
 if __name__ == "__main__":
     import uvicorn
-    # Запускаємо FastAPI-сервер через Uvicorn
-    uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=True)
+    # Запускаємо FastAPI-сервер через Uvicorn з uvloop та httptools
+    uvicorn.run(
+        "main:app",
+        host="127.0.0.1",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=settings.WEB_CONCURRENCY,
+    )
@@ -1,13 +1,12 @@
+import asyncio
 import logging
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.conf.config import settings
-from src.database.database import get_db
 from src.schemas.users import User
 from src.services.auth import get_current_user, get_current_admin_user
-from src.services.upload_file import UploadFileService
-from src.services.users import UserService
+from src.services.redis_cache import redis_cache
+from src.services.upload_file import upload_file
+from src.services.users import UserService, get_user_service
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -33,7 +32,7 @@ async def me(user: User = Depends(get_current_user)):
 async def update_avatar_user(
     file: UploadFile = File(),
     user: User = Depends(get_current_admin_user),
-    db: AsyncSession = Depends(get_db),
+    user_service: UserService = Depends(get_user_service),
 ):
     """
     Update user's avatar with a new image.
@@ -41,15 +40,13 @@ async def update_avatar_user(
     Args:
         file (UploadFile): The image file to upload.
         user (User): Authenticated admin user.
-        db (AsyncSession): Database session dependency.
+        user_service (UserService): User service dependency.
 
     Returns:
         User: Updated user profile with the new avatar URL.
     """
-    avatar_url = UploadFileService(
-        settings.CLD_NAME, settings.CLD_API_KEY, settings.CLD_API_SECRET
-    ).upload_file(file, user.username)
+    avatar_url = await asyncio.to_thread(upload_file, file, user.username)
 
-    user_service = UserService(db)
     updated_user = await user_service.update_avatar_url(user.email, avatar_url)
+    await redis_cache.delete(f"user:{user.username}")
     return updated_user
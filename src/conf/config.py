@@ -18,6 +18,18 @@ class Settings(BaseSettings):
     DB_HOST: str
     DB_PORT: str
 
+    # Connection pool settings (per worker process). Keep
+    # WEB_CONCURRENCY * (DB_POOL_SIZE + DB_MAX_OVERFLOW) below Postgres
+    # max_connections (100 by default).
+    DB_POOL_SIZE: int = 15
+    DB_MAX_OVERFLOW: int = 5
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    # Disable in-process pooling when PgBouncer manages connections
+    DB_USE_PGBOUNCER: bool = False
+    # Log every SQL statement (development only)
+    DB_ECHO: bool = False
+
     # JWT authentication settings
     JWT_SECRET: str
     JWT_ALGORITHM: str
@@ -42,11 +54,19 @@ class Settings(BaseSettings):
     CLD_NAME: str
     CLD_API_KEY: int
     CLD_API_SECRET: str
+    # Log full Cloudinary upload responses (development only)
+    CLD_LOG_RESPONSES: bool = False
 
     REDIS_HOST: str
     REDIS_PORT: int
     REDIS_DB: int
 
+    # Root logging level
+    LOG_LEVEL: str = "INFO"
+
+    # Number of Uvicorn worker processes
+    WEB_CONCURRENCY: int = 4
+
     @property
     def database_url(self) -> str:
         """
@@ -1,26 +1,55 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import NullPool
 
 from src.conf.config import settings
 
-import logging
-from sqlalchemy.engine import Engine
-
-# Увімкнення логів SQL-запитів
-logging.getLogger("sqlalchemy.engine").setLevel(logging.DEBUG)
-
 # Asynchronous database connection URL for PostgreSQL
 SQLALCHEMY_DATABASE_URL = settings.database_url.replace(
     "postgresql://", "postgresql+asyncpg://"
 )
 
+
+def create_db_engine():
+    """
+    Create the asynchronous SQLAlchemy engine with an explicit pool.
+
+    When ``DB_USE_PGBOUNCER`` is enabled, pooling is delegated to PgBouncer
+    and the engine opens a fresh connection per checkout (``NullPool``).
+    asyncpg's prepared statement cache is disabled as well, since it is
+    not compatible with PgBouncer's transaction pooling mode.
+
+    Returns:
+        AsyncEngine: Configured SQLAlchemy asynchronous engine.
+    """
+    if settings.DB_USE_PGBOUNCER:
+        return create_async_engine(
+            SQLALCHEMY_DATABASE_URL,
+            echo=settings.DB_ECHO,
+            poolclass=NullPool,
+            connect_args={"statement_cache_size": 0},
+        )
+    return create_async_engine(
+        SQLALCHEMY_DATABASE_URL,
+        echo=settings.DB_ECHO,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_pre_ping=True,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
+
+
 # Asynchronous SQLAlchemy engine
-engine = create_async_engine(SQLALCHEMY_DATABASE_URL, echo=True)
+engine = create_db_engine()
 
 # Asynchronous session factory
-AsyncSessionLocal = sessionmaker(
+AsyncSessionLocal = async_sessionmaker(
     bind=engine,
-    class_=AsyncSession,
     expire_on_commit=False,
 )
 
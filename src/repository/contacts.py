@@ -58,11 +58,14 @@ class ContactRepository:
 
     async def get_contacts(
         self, name: str, surname: str, email: str,
-        skip: int, limit: int, user: User
+        skip: int, limit: int, user: User, after_id: int | None = None
     ) -> List[Contact]:
         """
        Retrieve contacts for the authenticated user with optional filters.
 
+       Results are ordered by ID. When ``after_id`` is given, keyset
+       pagination is used instead of ``skip``.
+
        Args:
            name (str): Filter by name (optional).
            surname (str): Filter by surname (optional).
@@ -70,11 +73,13 @@ class ContactRepository:
            skip (int): Number of records to skip.
            limit (int): Maximum number of records to return.
            user (User): Authenticated user.
+           after_id (int, optional): Return contacts with ID greater
+           than this value.
 
        Returns:
            List[Contact]: List of contacts matching the filters.
        """
-        query = select(Contact).filter_by(user=user)
+        query = select(Contact).filter(Contact.user_id == user.id)
         if name:
             query = query.filter(Contact.name.contains(name))
         if surname:
@@ -82,7 +87,14 @@ class ContactRepository:
         if email:
             query = query.filter(Contact.email.contains(email))
 
-        result = await self.db.execute(query.offset(skip).limit(limit))
+        if after_id is not None:
+            query = query.filter(Contact.id > after_id)
+        else:
+            query = query.offset(skip)
+
+        result = await self.db.execute(
+            query.order_by(Contact.id).limit(limit)
+        )
         return result.scalars().all()
 
     async def get_contact_by_id(self, contact_id: int, user: User) -> Contact:
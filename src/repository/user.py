@@ -1,4 +1,4 @@
-from sqlalchemy import select
+from sqlalchemy import select, or_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import User
@@ -60,6 +60,28 @@ class UserRepository:
         user = await self.db.execute(stmt)
         return user.scalar_one_or_none()
 
+    async def get_existing_identifiers(
+        self, email: str, username: str
+    ) -> list[tuple[str, str]]:
+        """
+        Find users that already own the given email or username.
+
+        Args:
+            email (str): The email address to check.
+            username (str): The username to check.
+
+        Returns:
+            list[tuple[str, str]]: ``(email, username)`` pairs of matching
+            users, at most two.
+        """
+        stmt = (
+            select(User.email, User.username)
+            .where(or_(User.email == email, User.username == username))
+            .limit(2)
+        )
+        result = await self.db.execute(stmt)
+        return [tuple(row) for row in result.all()]
+
     async def create_user(self, body: UserCreate, avatar: str = None) -> User:
         """
         Create a new user in the database.
@@ -81,16 +103,29 @@ class UserRepository:
         await self.db.refresh(user)
         return user
 
-    async def confirmed_email(self, email: str) -> None:
+    async def mark_verified(self, email: str) -> str | None:
         """
-        Mark a user's email as verified.
+        Mark a user's email as verified with a single UPDATE statement.
+
+        Only users that are not verified yet are updated.
 
         Args:
             email (str): The email address of the user.
-        """
-        user = await self.get_user_by_email(email)
-        user.is_verified = True
+
+        Returns:
+            str | None: Username of the updated user, or None if no
+            unverified user with this email exists.
+        """
+        stmt = (
+            update(User)
+            .where(User.email == email, User.is_verified.is_not(True))
+            .values(is_verified=True)
+            .returning(User.username)
+        )
+        result = await self.db.execute(stmt)
+        username = result.scalar_one_or_none()
         await self.db.commit()
+        return username
 
     async def update_avatar_url(self, email: str, url: str) -> User:
         """
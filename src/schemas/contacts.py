@@ -2,27 +2,28 @@ import re
 from datetime import date, datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field, ConfigDict, EmailStr, validator
+from pydantic import BaseModel, Field, ConfigDict, EmailStr, field_validator
 
 
 class ContactModel(BaseModel):
     """
     Schema for creating and validating contact data.
     """
-    name: str = Field(min_length=2, max_length=50, example="John")
-    surname: str = Field(min_length=2, max_length=50, example="Doe")
+    name: str = Field(min_length=2, max_length=50, examples=["John"])
+    surname: str = Field(min_length=2, max_length=50, examples=["Doe"])
     email: EmailStr = Field(
-        min_length=7, max_length=100, example="john.doe@example.com"
+        min_length=7, max_length=100, examples=["john.doe@example.com"]
     )
     phone: str = Field(
-        min_length=7, max_length=20, example="+380501234567"
+        min_length=7, max_length=20, examples=["+380501234567"]
     )
-    birthday: date = Field(example="1990-01-01")
+    birthday: date = Field(examples=["1990-01-01"])
     info: Optional[str] = Field(
-        None, max_length=500, example="Additional info"
+        None, max_length=500, examples=["Additional info"]
     )
 
-    @validator("phone")
+    @field_validator("phone")
+    @classmethod
     def validate_phone(cls, value):
         """
         Validate phone number format to ensure it follows
@@ -45,7 +46,8 @@ class ContactModel(BaseModel):
             )
         return value
 
-    @validator("birthday")
+    @field_validator("birthday")
+    @classmethod
     def validate_birthday(cls, value):
         """
         Ensure that the provided birthday is not set in the future.
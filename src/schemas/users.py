@@ -56,6 +56,7 @@ class UserCacheModel(BaseModel):
     id: int
     username: str
     email: str
+    avatar: str | None = None
     is_verified: bool
     role: str
 
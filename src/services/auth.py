@@ -1,4 +1,5 @@
 import logging
+import random
 
 from datetime import datetime, timedelta, UTC
 from typing import Optional
@@ -6,13 +7,12 @@ from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from passlib.context import CryptContext
-from sqlalchemy.orm import Session
-from jose import JWTError, jwt
+import jwt
+from jwt import InvalidTokenError
 
 from src.conf.config import settings
-from src.database.database import get_db
 from src.database.models import User, UserRole
-from src.services.users import UserService
+from src.services.users import UserService, get_user_service
 from src.services.redis_cache import redis_cache
 from src.schemas.users import UserCacheModel
 
@@ -51,6 +51,27 @@ class Hash:
 
 oauth2_scheme = HTTPBearer()
 
+# Signing key and algorithm list are resolved once instead of per call
+_SECRET_BYTES = settings.JWT_SECRET.encode()
+_ALGORITHMS = [settings.JWT_ALGORITHM]
+
+# Relative spread applied to token and cache lifetimes
+TTL_JITTER = 0.1
+
+
+def jittered_ttl(seconds: int) -> int:
+    """
+    Randomizes a lifetime by ±TTL_JITTER so entries issued together
+    do not all expire at the same instant.
+
+    Args:
+        seconds (int): Base lifetime in seconds.
+
+    Returns:
+        int: Lifetime in seconds with jitter applied.
+    """
+    return int(seconds * (1 + random.uniform(-TTL_JITTER, TTL_JITTER)))
+
 
 async def create_access_token(data: dict, expires_delta: Optional[int] = None):
     """
@@ -58,36 +79,32 @@ async def create_access_token(data: dict, expires_delta: Optional[int] = None):
 
     Args:
         data (dict): Dictionary containing payload data.
-        expires_delta (Optional[int]): Expiration time in seconds.
+        expires_delta (Optional[int]): Expiration time in seconds,
+            randomized by ±10% to spread out token expiry.
 
     Returns:
         str: Encoded JWT token.
     """
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.now(UTC) + timedelta(seconds=expires_delta)
-    else:
-        expire = datetime.now(UTC) + timedelta(
-            seconds=settings.JWT_EXPIRATION_SECONDS
-        )
+    ttl = expires_delta or settings.JWT_EXPIRATION_SECONDS
+    expire = datetime.now(UTC) + timedelta(seconds=jittered_ttl(ttl))
     to_encode.update({"exp": expire})
-    print("to_encode", to_encode)
     encoded_jwt = jwt.encode(
-        to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM
+        to_encode, _SECRET_BYTES, algorithm=settings.JWT_ALGORITHM
     )
     return encoded_jwt
 
 
 async def get_current_user(
     token: HTTPAuthorizationCredentials = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
+    user_service: UserService = Depends(get_user_service),
 ):
     """
     Retrieves the current authenticated user from the JWT token.
 
     Args:
         token (HTTPAuthorizationCredentials): JWT token containing user credentials.
-        db (Session): Database session.
+        user_service (UserService): User service dependency.
 
     Returns:
         User: Authenticated user object.
@@ -104,15 +121,12 @@ async def get_current_user(
     try:
         # Decode JWT token
         payload = jwt.decode(
-            token.credentials,
-            settings.JWT_SECRET,
-            algorithms=[settings.JWT_ALGORITHM]
+            token.credentials, _SECRET_BYTES, algorithms=_ALGORITHMS
         )
-        print("payload", payload)
         username = payload["sub"]
         if username is None:
             raise credentials_exception
-    except JWTError as e:
+    except InvalidTokenError as e:
         logging.error(f"JWT Error: {e}")
         raise credentials_exception
 
@@ -122,7 +136,6 @@ async def get_current_user(
         return UserCacheModel(**user_data)  # 🔹 Використання правильної моделі
 
     # Якщо користувача немає в Redis – шукаємо в базі
-    user_service = UserService(db)
     user = await user_service.get_user_by_username(username)
     if not user:
         raise credentials_exception
@@ -132,11 +145,12 @@ async def get_current_user(
         id=user.id,
         username=user.username,
         email=user.email,
+        avatar=user.avatar,
         is_verified=user.is_verified,
         role=user.role
-    ).dict()
+    ).model_dump()
 
-    await redis_cache.set(f"user:{user.username}", cached_user, expire=3600)
+    await redis_cache.set(f"user:{user.username}", cached_user, expire=jittered_ttl(3600))
     logging.info(f"💾 Користувач {username} закешований у Redis")
 
     return user
@@ -156,7 +170,7 @@ def create_email_token(data: dict):
     expire = datetime.now(UTC) + timedelta(days=7)
     to_encode.update({"iat": datetime.now(UTC), "exp": expire})
     token = jwt.encode(
-        to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM
+        to_encode, _SECRET_BYTES, algorithm=settings.JWT_ALGORITHM
     )
     return token
 
@@ -175,12 +189,10 @@ async def get_email_from_token(token: str):
         HTTPException: If the token is invalid.
     """
     try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = jwt.decode(token, _SECRET_BYTES, algorithms=_ALGORITHMS)
         email = payload["sub"]
         return email
-    except JWTError as e:
+    except InvalidTokenError as e:
         logging.error(f"JWT Error: {e}")
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -192,9 +204,7 @@ async def get_password_from_token(token: str) -> str:
     Отримує пароль з токену для скидання пароля.
     """
     try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = jwt.decode(token, _SECRET_BYTES, algorithms=_ALGORITHMS)
         password = payload.get("password")  # Використати get, щоб уникнути KeyError
         if not password:
             raise HTTPException(
@@ -202,7 +212,7 @@ async def get_password_from_token(token: str) -> str:
                 detail="Token does not contain a password",
             )
         return password
-    except JWTError as e:
+    except InvalidTokenError as e:
         logging.error(f"JWT Error: {e}")
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -1,8 +1,27 @@
-from fastapi import HTTPException, status
+from fastapi import Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.database import get_db
 from src.database.models import User
 from src.repository.contacts import ContactRepository
-from src.schemas.contacts import ContactModel
+from src.schemas.contacts import ContactModel, ContactResponse
+from src.services.redis_cache import redis_cache
+
+# TTL of the cached first page of contacts
+CONTACTS_PAGE0_TTL = 60
+
+
+def page0_cache_key(user: User) -> str:
+    """
+    Build the Redis key holding the user's cached first pages.
+
+    Pages for different limits are stored as fields of one hash so a
+    single delete invalidates all of them.
+
+    :param user: Contacts owner.
+    :return: Redis key.
+    """
+    return f"contacts:page0:{user.id}"
 
 
 class ContactService:
@@ -34,7 +53,9 @@ class ContactService:
                 detail=f"Contact with '{body.email}' email or "
                 f"'{body.phone}' phone number already exists.",
             )
-        return await self.repository.create_contact(body, user)
+        contact = await self.repository.create_contact(body, user)
+        await redis_cache.delete(page0_cache_key(user))
+        return contact
 
     async def get_contacts(
         self,
@@ -43,24 +64,48 @@ class ContactService:
             email: str,
             skip: int,
             limit: int,
-            user: User
+            user: User,
+            after_id: int | None = None
     ):
         """
         Retrieve a list of contacts with optional filtering.
 
+        The unfiltered first page is served from Redis when cached.
+
         :param name: Filter by name (optional).
         :param surname: Filter by surname (optional).
         :param email: Filter by email (optional).
         :param skip: Number of records to skip.
         :param limit: Maximum number of records to return.
         :param user: Current authenticated user.
+        :param after_id: Return contacts with ID greater than this value
+        (keyset pagination, optional).
         :return: List of contacts.
         """
+        is_page0 = (
+            not (name or surname or email) and skip == 0 and after_id is None
+        )
+        if is_page0:
+            cached = await redis_cache.hget(page0_cache_key(user), str(limit))
+            if cached is not None:
+                return cached
 
-        return await self.repository.get_contacts(
-            name, surname, email, skip, limit, user
+        contacts = await self.repository.get_contacts(
+            name, surname, email, skip, limit, user, after_id
         )
 
+        if is_page0:
+            await redis_cache.hset(
+                page0_cache_key(user),
+                str(limit),
+                [
+                    ContactResponse.model_validate(c).model_dump(mode="json")
+                    for c in contacts
+                ],
+                expire=CONTACTS_PAGE0_TTL,
+            )
+        return contacts
+
     async def get_contact(self, contact_id: int, user: User):
         """
         Retrieve a specific contact by ID.
@@ -100,6 +145,7 @@ class ContactService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Contact not found",
             )
+        await redis_cache.delete(page0_cache_key(user))
         return updated_contact
 
     async def remove_contact(self, contact_id: int, user: User):
@@ -119,6 +165,7 @@ class ContactService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Contact not found",
             )
+        await redis_cache.delete(page0_cache_key(user))
         return deleted_contact
 
     async def get_upcoming_birthdays(self, days: int, user: User):
@@ -130,3 +177,13 @@ class ContactService:
        :return: List of contacts with upcoming birthdays.
        """
         return await self.repository.get_upcoming_birthdays(days, user)
+
+
+def get_contact_service(db: AsyncSession = Depends(get_db)) -> ContactService:
+    """
+    Dependency providing a ContactService bound to the request's session.
+
+    :param db: Async database session.
+    :return: ContactService instance.
+    """
+    return ContactService(db)
@@ -1,91 +1,144 @@
+import asyncio
 import logging
-from pathlib import Path
+from email.message import EmailMessage
+from email.utils import formataddr
 
-from fastapi_mail import (
-    FastMail,
-    MessageSchema,
-    ConnectionConfig,
-    MessageType,
-)
-from fastapi_mail.errors import ConnectionErrors
-from fastapi import HTTPException,status
+import aiosmtplib
+from jinja2 import Environment, FileSystemLoader, select_autoescape
 from pydantic import EmailStr
 
 from src.conf.config import settings
-from src.services.auth import create_email_token, create_access_token
-
-# Configuration for email sending
-conf = ConnectionConfig(
-    MAIL_USERNAME=settings.MAIL_USERNAME,
-    MAIL_PASSWORD=settings.MAIL_PASSWORD,
-    MAIL_FROM=settings.MAIL_FROM,
-    MAIL_PORT=settings.MAIL_PORT,
-    MAIL_SERVER=settings.MAIL_SERVER,
-    MAIL_FROM_NAME=settings.MAIL_FROM_NAME,
-    MAIL_STARTTLS=settings.MAIL_STARTTLS,
-    MAIL_SSL_TLS=settings.MAIL_SSL_TLS,
-    USE_CREDENTIALS=settings.USE_CREDENTIALS,
-    VALIDATE_CERTS=settings.VALIDATE_CERTS,
-    TEMPLATE_FOLDER=Path(__file__).parent.parent / "services" / "templates",
-    SUPPRESS_SEND=False,  # Не ігнорувати відправку
-    MAIL_DEBUG=True,
+from src.services.auth import create_email_token
+
+# Template environment for email bodies
+templates = Environment(
+    loader=FileSystemLoader(settings.TEMPLATE_FOLDER),
+    autoescape=select_autoescape(["html"]),
 )
 
+# Outgoing messages, consumed by a single email_worker per process
+email_queue: asyncio.Queue[EmailMessage] = asyncio.Queue()
+
+# How long shutdown waits for queued messages to be sent, in seconds
+EMAIL_DRAIN_TIMEOUT = 10
+
 
-async def send_email(email: EmailStr, username: str, host: str):
+def build_message(
+    email: EmailStr, subject: str, template_name: str, template_body: dict
+) -> EmailMessage:
     """
-    Sends an email for account verification.
+    Renders an HTML template into an email message.
+
+    :param email: Recipient's email address.
+    :param subject: Message subject.
+    :param template_name: Template file name in the templates folder.
+    :param template_body: Variables passed to the template.
+    :return: Ready to send email message.
+    """
+    message = EmailMessage()
+    message["From"] = formataddr((settings.MAIL_FROM_NAME, settings.MAIL_FROM))
+    message["To"] = email
+    message["Subject"] = subject
+    message.set_content(
+        templates.get_template(template_name).render(**template_body),
+        subtype="html",
+    )
+    return message
+
+
+def send_email(email: EmailStr, username: str, host: str):
+    """
+    Queues an email for account verification.
 
     :param email: Recipient's email address.
     :param username: User's username.
     :param host: Base URL of the application.
     """
-    try:
-        token_verification = create_email_token({"sub": email})
-        message = MessageSchema(
-            subject="Confirm your email",
-            recipients=[email],
-            template_body={
-                "host": host,
-                "username": username,
-                "token": token_verification,
-            },
-            subtype=MessageType.html,
-        )
-
-        fm = FastMail(conf)
-        await fm.send_message(message, template_name="verify_email.html")
-    except ConnectionErrors as err:
-        print(err)  # Log the error if sending fails
-
-
-async def send_reset_password_email(email: EmailStr, username: str, base_url: str, reset_token: str):
+    token_verification = create_email_token({"sub": email})
+    message = build_message(
+        email,
+        "Confirm your email",
+        "verify_email.html",
+        {"host": host, "username": username, "token": token_verification},
+    )
+    email_queue.put_nowait(message)
+
+
+def send_reset_password_email(email: EmailStr, username: str, base_url: str, reset_token: str):
+    """
+    Queues an email with a password reset link.
     """
-    Sends an email with a password reset link.
+    reset_link = f"{base_url.rstrip('/')}/auth/reset-password/{reset_token}"
+    logging.info(f"🟢 Queueing password reset email to {email} with link {reset_link}")
+    message = build_message(
+        email,
+        "Reset your password",
+        "reset_password.html",
+        {"username": username, "reset_link": reset_link},
+    )
+    email_queue.put_nowait(message)
+
+
+async def _connect() -> aiosmtplib.SMTP:
+    """
+    Opens an authenticated SMTP connection using the mail settings.
+
+    :return: Connected SMTP client.
+    """
+    smtp = aiosmtplib.SMTP(
+        hostname=settings.MAIL_SERVER,
+        port=settings.MAIL_PORT,
+        use_tls=settings.MAIL_SSL_TLS,
+        start_tls=settings.MAIL_STARTTLS,
+        validate_certs=settings.VALIDATE_CERTS,
+    )
+    await smtp.connect()
+    if settings.USE_CREDENTIALS:
+        await smtp.login(settings.MAIL_USERNAME, settings.MAIL_PASSWORD)
+    return smtp
+
+
+def _close(smtp: aiosmtplib.SMTP | None):
+    """
+    Closes an SMTP connection if it is still open.
+
+    :param smtp: SMTP client or None.
+    """
+    if smtp is not None and smtp.is_connected:
+        smtp.close()
+
+
+async def email_worker(queue: asyncio.Queue[EmailMessage]):
+    """
+    Sends queued messages over a single reused SMTP connection.
+
+    The connection is opened lazily. If a reused connection turns out to
+    be dropped, the worker reconnects and retries the message once. Any
+    other failure is logged and the worker moves on to the next message,
+    so one broken send never stops the consumer.
+
+    :param queue: Queue of messages to send.
     """
+    smtp = None
     try:
-        reset_link = f"{base_url.rstrip('/')}/auth/reset-password/{reset_token}"
-        logging.info(
-            f"🟢 Sending password reset email to {email} with link {reset_link}")
-        message = MessageSchema(
-            subject="""\
-                    Subject: Hello
-
-                    This is a simple test message.""",
-            recipients=[email],
-            template_body={
-                "username": username,
-                "reset_link": reset_link,
-            },
-            subtype=MessageType.html,
-        )
-
-        fm = FastMail(conf)
-        await fm.send_message(message, template_name="reset_password.html")
-        logging.info(f"Email sent to {email} with reset link: {reset_link}")
-    except ConnectionErrors as err:
-        logging.error(f"Error sending password reset email: {err}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to send email",
-        )
\ No newline at end of file
+        while True:
+            message = await queue.get()
+            try:
+                if smtp is None or not smtp.is_connected:
+                    smtp = await _connect()
+                try:
+                    await smtp.send_message(message)
+                except (aiosmtplib.SMTPServerDisconnected, OSError):
+                    # A reused connection may be half-open: reconnect once
+                    _close(smtp)
+                    smtp = await _connect()
+                    await smtp.send_message(message)
+                logging.info(f"Email sent to {message['To']}")
+            except Exception:
+                logging.exception(f"Error sending email to {message['To']}")
+                _close(smtp)
+                smtp = None
+            finally:
+                queue.task_done()
+    finally:
+        _close(smtp)
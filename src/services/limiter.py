@@ -1,23 +1,75 @@
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-from fastapi import APIRouter, Request
-from src.schemas.users import User
-
-limiter = Limiter(key_func=get_remote_address)
-router = APIRouter(prefix="/users", tags=["users"])
-
-
-@router.get(
-    "/me",
-    response_model=User,
-    description="No more than 10 requests per minute"
-)
-@limiter.limit("5/minute")
-async def my_endpoint(request: Request):
+from fastapi import HTTPException, Request, status
+
+from src.services.redis_cache import redis_cache
+
+# Token bucket: refill and consume atomically in a single round-trip.
+# KEYS[1] - bucket key; ARGV - capacity, refill rate (tokens/sec).
+# The clock is read from Redis so app hosts with skewed clocks agree.
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local time = redis.call("TIME")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "ts")
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+
+redis.call("HSET", KEYS[1], "tokens", tokens, "ts", now)
+redis.call("EXPIRE", KEYS[1], math.ceil(capacity / rate))
+return allowed
+"""
+
+
+class RateLimiter:
     """
-    Protected route with rate limiting.
+    Залежність FastAPI, що обмежує частоту запитів через token bucket у Redis.
 
-    :param request: FastAPI request object.
-    :return: Message confirming successful access.
+    Стан спільний для всіх воркерів, ключ складається з маршруту та
+    IP-адреси клієнта. Якщо Redis не підключений, запити не обмежуються.
     """
-    return {"message": "This is my rate-limited endpoint."}
+
+    _script = None
+
+    def __init__(self, times: int, seconds: int):
+        """
+        :param times: Кількість запитів (місткість кошика).
+        :param seconds: Період, за який кошик повністю поповнюється.
+        """
+        self.capacity = times
+        self.rate = times / seconds
+
+    @classmethod
+    def _get_script(cls):
+        # register_script виконує EVALSHA і завантажує скрипт лише за потреби
+        if cls._script is None:
+            cls._script = redis_cache.redis.register_script(TOKEN_BUCKET_SCRIPT)
+        return cls._script
+
+    async def __call__(self, request: Request):
+        """
+        Списує токен для поточного запиту.
+
+        :param request: FastAPI request object.
+        :raises HTTPException: 429, якщо ліміт вичерпано.
+        """
+        if not redis_cache.redis:
+            return
+
+        host = request.client.host if request.client else "unknown"
+        key = f"rate_limit:{request.url.path}:{host}"
+        allowed = await self._get_script()(
+            keys=[key], args=[self.capacity, self.rate]
+        )
+        if not allowed:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Перевищено ліміт запитів. Спробуйте пізніше.",
+            )
@@ -1,7 +1,12 @@
+import orjson
 import redis.asyncio as redis
-import json
 from src.conf.config import settings
 
+# Версія формату серіалізації (orjson) у просторі імен ключів: під час
+# поступового деплою старі воркери читають ключі без префікса у форматі
+# json.dumps, а нові – лише ключі з префіксом, тож формати не змішуються
+CACHE_KEY_PREFIX = "v1:"
+
 class RedisCache:
     def __init__(self):
         self.redis = None
@@ -12,21 +17,48 @@ class RedisCache:
                 f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}/{settings.REDIS_DB}"
             )
 
+    @staticmethod
+    def _key(key: str) -> str:
+        """
+        Додає до ключа префікс версії формату.
+        """
+        return CACHE_KEY_PREFIX + key
+
     async def set(self, key: str, value: dict, expire: int = 3600):
         """
         Зберігає значення в Redis з вказаним ключем.
         """
         if self.redis:
-            await self.redis.set(key, json.dumps(value), ex=expire)
+            await self.redis.set(self._key(key), orjson.dumps(value), ex=expire)
 
     async def get(self, key: str):
         """
         Отримує значення з Redis за ключем.
         """
         if self.redis:
-            data = await self.redis.get(key)
+            data = await self.redis.get(self._key(key))
+            if data:
+                return orjson.loads(data)
+        return None
+
+    async def hset(self, key: str, field: str, value, expire: int = 3600):
+        """
+        Зберігає значення в полі хешу Redis та оновлює TTL всього хешу.
+        """
+        if self.redis:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.hset(self._key(key), field, orjson.dumps(value))
+                pipe.expire(self._key(key), expire)
+                await pipe.execute()
+
+    async def hget(self, key: str, field: str):
+        """
+        Отримує значення поля хешу Redis.
+        """
+        if self.redis:
+            data = await self.redis.hget(self._key(key), field)
             if data:
-                return json.loads(data)
+                return orjson.loads(data)
         return None
 
     async def delete(self, key: str):
@@ -34,6 +66,6 @@ class RedisCache:
         Видаляє значення з Redis.
         """
         if self.redis:
-            await self.redis.delete(key)
+            await self.redis.delete(self._key(key))
 
 redis_cache = RedisCache()
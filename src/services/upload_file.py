@@ -1,55 +1,70 @@
 import logging
+from functools import lru_cache
+
 import cloudinary
 import cloudinary.uploader
+from cloudinary.utils import cloudinary_url
+
+from src.conf.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Chunk size for streaming uploads to Cloudinary (6 MB)
+UPLOAD_CHUNK_SIZE = 6_000_000
 
-# Configure logging for debugging
-logging.basicConfig(level=logging.DEBUG)
+# Configure the Cloudinary SDK once at import time
+cloudinary.config(
+    cloud_name=settings.CLD_NAME,
+    api_key=settings.CLD_API_KEY,
+    api_secret=settings.CLD_API_SECRET,
+    secure=True,
+)
 
 
-class UploadFileService:
+@lru_cache(maxsize=1024)
+def avatar_base_url(public_id: str) -> str:
     """
-    Service for uploading files to Cloudinary.
+    Build the unversioned avatar delivery URL for a public ID.
+
+    The public ID and transformation are fixed per user, so the URL is
+    assembled once and reused for subsequent uploads.
+
+    :param public_id: Cloudinary public ID of the avatar.
+    :return: Delivery URL with the avatar transformation applied.
     """
+    url, _ = cloudinary_url(
+        public_id, width=250, height=250, crop="fill", force_version=False
+    )
+    return url
 
-    def __init__(self, cloud_name, api_key, api_secret):
-        """
-        Initialize the Cloudinary configuration.
-
-        :param cloud_name: Cloudinary cloud name.
-        :param api_key: Cloudinary API key.
-        :param api_secret: Cloudinary API secret.
-        """
-        self.cloud_name = cloud_name
-        self.api_key = api_key
-        self.api_secret = api_secret
-        cloudinary.config(
-            cloud_name=self.cloud_name,
-            api_key=self.api_key,
-            api_secret=self.api_secret,
-            secure=True,
-        )
 
-    @staticmethod
-    def upload_file(file, username) -> str:
-        """
-        Upload a file to Cloudinary and return the URL.
-
-        :param file: File object to be uploaded.
-        :param username: Username for unique file identification.
-        :return: URL of the uploaded file.
-        """
-        logging.debug(f"Uploading file for user: {username}")
-
-        try:
-            public_id = f"RestApp/{username}"
-            r = cloudinary.uploader.upload(
-                file.file, public_id=public_id, overwrite=True
-            )
-            logging.debug(f"Upload response: {r}")
-            src_url = cloudinary.CloudinaryImage(public_id).build_url(
-                width=250, height=250, crop="fill", version=r.get("version")
-            )
-            return src_url
-        except Exception as e:
-            logging.error(f"Cloudinary upload error: {e}")
-            raise
+def upload_file(file, username) -> str:
+    """
+    Upload a file to Cloudinary and return the URL.
+
+    This is a blocking call; run it in a worker thread from async code.
+
+    :param file: File object to be uploaded.
+    :param username: Username for unique file identification.
+    :return: URL of the uploaded file.
+    """
+    logger.debug("Uploading file for user: %s", username)
+
+    try:
+        public_id = f"RestApp/{username}"
+        # Send the spooled file in chunks instead of reading it whole;
+        # upload_large defaults to raw assets, so request an image explicitly
+        r = cloudinary.uploader.upload_large(
+            file.file,
+            resource_type="image",
+            chunk_size=UPLOAD_CHUNK_SIZE,
+            public_id=public_id,
+            overwrite=True,
+        )
+        if settings.CLD_LOG_RESPONSES:
+            logger.debug("Upload response: %s", r)
+        # The version only busts the CDN cache after an overwrite
+        return f"{avatar_base_url(public_id)}?v={r['version']}"
+    except Exception as e:
+        logger.error("Cloudinary upload error: %s", e)
+        raise
@@ -1,6 +1,8 @@
+from fastapi import Depends
 from libgravatar import Gravatar
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.database.database import get_db
 from src.repository.user import UserRepository
 from src.schemas.users import UserCreate
 
@@ -61,14 +63,24 @@ class UserService:
         """
         return await self.repository.get_user_by_email(email)
 
-    async def confirmed_email(self, email: str):
+    async def get_existing_identifiers(self, email: str, username: str):
         """
-         Mark a user's email as verified.
+        Retrieve identifiers of users that match the email or username.
 
-         :param email: Email address of the user.
-         :return: None.
+        :param email: Email address to check.
+        :param username: Username to check.
+        :return: List of (email, username) pairs already in use.
         """
-        return await self.repository.confirmed_email(email)
+        return await self.repository.get_existing_identifiers(email, username)
+
+    async def mark_verified(self, email: str):
+        """
+        Mark a user's email as verified if it is not verified yet.
+
+        :param email: Email address of the user.
+        :return: Username of the updated user or None.
+        """
+        return await self.repository.mark_verified(email)
 
     async def update_avatar_url(self, email: str, url: str):
         """
@@ -93,3 +105,13 @@ class UserService:
         """
         # Скидання пароля користувача
         return await self.repository.reset_password(user_id, password)
+
+
+def get_user_service(db: AsyncSession = Depends(get_db)) -> UserService:
+    """
+    Dependency providing a UserService bound to the request's session.
+
+    :param db: Asynchronous database session.
+    :return: UserService instance.
+    """
+    return UserService(db)
@@ -0,0 +1,117 @@
+import pytest
+from unittest.mock import AsyncMock
+from fastapi import HTTPException
+
+from src.api.auth import confirmed_email, get_user_or_404, user_miss_key
+from src.database.models import User
+
+
+@pytest.fixture
+def redis_mock(monkeypatch):
+    """Фікстура для мок-об'єкта кешу Redis."""
+    mock = AsyncMock()
+    mock.get.return_value = None
+    monkeypatch.setattr("src.api.auth.redis_cache", mock)
+    return mock
+
+
+@pytest.fixture
+def test_user():
+    """Фікстура для тестового користувача."""
+    return User(id=1, username="testuser", email="testuser@example.com")
+
+
+@pytest.mark.asyncio
+async def test_get_user_or_404_found_without_marker(redis_mock, test_user):
+    """Тест: без маркера відсутності користувач знаходиться в БД."""
+    user_service = AsyncMock()
+    user_service.get_user_by_email.return_value = test_user
+
+    user = await get_user_or_404(user_service, "testuser@example.com")
+
+    assert user is test_user
+    redis_mock.get.assert_awaited_once_with("auth:miss:testuser@example.com")
+    redis_mock.set.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_user_or_404_caches_miss(redis_mock):
+    """Тест: невідомий email кешується як маркер відсутності."""
+    user_service = AsyncMock()
+    user_service.get_user_by_email.return_value = None
+
+    with pytest.raises(HTTPException) as exc:
+        await get_user_or_404(user_service, "unknown@example.com")
+
+    assert exc.value.status_code == 404
+    redis_mock.set.assert_awaited_once()
+    assert redis_mock.set.await_args.args[0] == "auth:miss:unknown@example.com"
+
+
+@pytest.mark.asyncio
+async def test_get_user_or_404_marker_skips_db(redis_mock):
+    """Тест: наявний маркер повертає 404 без запиту до БД."""
+    redis_mock.get.return_value = "1"
+    user_service = AsyncMock()
+
+    with pytest.raises(HTTPException) as exc:
+        await get_user_or_404(user_service, "unknown@example.com")
+
+    assert exc.value.status_code == 404
+    user_service.get_user_by_email.assert_not_awaited()
+
+
+def test_user_miss_key_outside_user_namespace():
+    """Тест: ключ маркера не перетинається з кешем user:{username}."""
+    assert not user_miss_key("victim@example.com").startswith("user:")
+
+
+@pytest.fixture
+def email_token(monkeypatch):
+    """Фікстура: токен підтвердження декодується в тестовий email."""
+    monkeypatch.setattr(
+        "src.api.auth.get_email_from_token",
+        AsyncMock(return_value="testuser@example.com"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_confirmed_email_marks_verified(redis_mock, email_token):
+    """Тест: неверифікований email підтверджується, кеш користувача скидається."""
+    user_service = AsyncMock()
+    user_service.mark_verified.return_value = "testuser"
+
+    result = await confirmed_email("token", user_service=user_service)
+
+    assert result == {"message": "Email successfully verified."}
+    user_service.mark_verified.assert_awaited_once_with("testuser@example.com")
+    user_service.get_user_by_email.assert_not_awaited()
+    redis_mock.delete.assert_awaited_once_with("user:testuser")
+
+
+@pytest.mark.asyncio
+async def test_confirmed_email_already_verified(redis_mock, email_token, test_user):
+    """Тест: повторне підтвердження повертає повідомлення без змін."""
+    user_service = AsyncMock()
+    user_service.mark_verified.return_value = None
+    user_service.get_user_by_email.return_value = test_user
+
+    result = await confirmed_email("token", user_service=user_service)
+
+    assert result == {"message": "Your email is already verified."}
+    redis_mock.delete.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_confirmed_email_unknown_user(redis_mock, email_token):
+    """Тест: невідомий email повертає 400."""
+    user_service = AsyncMock()
+    user_service.mark_verified.return_value = None
+    user_service.get_user_by_email.return_value = None
+
+    with pytest.raises(HTTPException) as exc:
+        await confirmed_email("token", user_service=user_service)
+
+    assert exc.value.status_code == 400
+    assert exc.value.detail == "Verification error"
+    redis_mock.delete.assert_not_awaited()
@@ -73,6 +73,27 @@ async def test_get_contacts(contact_repository, mock_session, user):
     assert contacts[0].email == "john.doe@example.com"
 
 
+@pytest.mark.asyncio
+async def test_get_contacts_after_id(contact_repository, mock_session, user):
+    """Тест отримання наступної сторінки контактів за курсором after_id."""
+    mock_result = MagicMock()
+    mock_result.scalars.return_value.all.return_value = [
+        Contact(id=2, name="Jane", surname="Doe", email="jane.doe@example.com",
+                user=user)
+    ]
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    contacts = await contact_repository.get_contacts(name="", surname="",
+                                                     email="", skip=0,
+                                                     limit=10, user=user,
+                                                     after_id=1)
+
+    assert len(contacts) == 1
+    assert contacts[0].id == 2
+    query = mock_session.execute.await_args.args[0]
+    assert "contacts.id >" in str(query)
+
+
 @pytest.mark.asyncio
 async def test_get_contact_by_id(contact_repository, mock_session, user):
     """Тест отримання контакту за ID."""
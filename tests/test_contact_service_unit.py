@@ -0,0 +1,122 @@
+from datetime import date, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.database.models import Contact, User
+from src.schemas.contacts import ContactModel
+from src.services.contacts import ContactService, page0_cache_key
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Фікстура для мок-об'єкта кешу Redis."""
+    mock = AsyncMock()
+    mock.hget.return_value = None
+    monkeypatch.setattr("src.services.contacts.redis_cache", mock)
+    return mock
+
+
+@pytest.fixture
+def user():
+    """Фікстура для створення тестового користувача."""
+    return User(id=1, username="testuser")
+
+
+@pytest.fixture
+def contact(user):
+    """Фікстура для тестового контакту."""
+    return Contact(
+        id=1, name="John", surname="Doe", email="john.doe@example.com",
+        phone="+380501234567", birthday=date(1990, 1, 1),
+        created_at=datetime(2025, 1, 1), updated_at=datetime(2025, 1, 1),
+        info=None, user_id=user.id,
+    )
+
+
+@pytest.fixture
+def body():
+    """Фікстура для даних контакту."""
+    return ContactModel(
+        name="John", surname="Doe", email="john.doe@example.com",
+        phone="+380501234567", birthday=date(1990, 1, 1),
+    )
+
+
+@pytest.fixture
+def service():
+    """Фікстура для `ContactService` з мок-репозиторієм."""
+    service = ContactService(AsyncMock())
+    service.repository = AsyncMock()
+    return service
+
+
+@pytest.mark.asyncio
+async def test_get_contacts_page0_cache_hit(service, cache, user):
+    """Тест: закешована перша сторінка повертається без запиту до БД."""
+    cached = [{"id": 1, "name": "John"}]
+    cache.hget.return_value = cached
+
+    contacts = await service.get_contacts(None, None, None, 0, 10, user)
+
+    assert contacts == cached
+    cache.hget.assert_awaited_once_with(page0_cache_key(user), "10")
+    service.repository.get_contacts.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_contacts_page0_cache_miss(service, cache, user, contact):
+    """Тест: при промаху перша сторінка зберігається через hset."""
+    service.repository.get_contacts.return_value = [contact]
+
+    contacts = await service.get_contacts(None, None, None, 0, 10, user)
+
+    assert contacts == [contact]
+    cache.hset.assert_awaited_once()
+    key, field, value = cache.hset.await_args.args
+    assert (key, field) == (page0_cache_key(user), "10")
+    assert value[0]["id"] == 1
+    assert value[0]["email"] == "john.doe@example.com"
+
+
+@pytest.mark.asyncio
+async def test_get_contacts_filtered_not_cached(service, cache, user, contact):
+    """Тест: відфільтровані сторінки не кешуються."""
+    service.repository.get_contacts.return_value = [contact]
+
+    await service.get_contacts("John", None, None, 0, 10, user)
+    await service.get_contacts(None, None, None, 0, 10, user, after_id=5)
+
+    cache.hget.assert_not_awaited()
+    cache.hset.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_create_contact_invalidates_page0(service, cache, user, contact, body):
+    """Тест: створення контакту скидає кеш першої сторінки."""
+    service.repository.is_contact_exists.return_value = False
+    service.repository.create_contact.return_value = contact
+
+    await service.create_contact(body, user)
+
+    cache.delete.assert_awaited_once_with(page0_cache_key(user))
+
+
+@pytest.mark.asyncio
+async def test_update_contact_invalidates_page0(service, cache, user, contact, body):
+    """Тест: оновлення контакту скидає кеш першої сторінки."""
+    service.repository.update_contact.return_value = contact
+
+    await service.update_contact(1, body, user)
+
+    cache.delete.assert_awaited_once_with(page0_cache_key(user))
+
+
+@pytest.mark.asyncio
+async def test_remove_contact_invalidates_page0(service, cache, user, contact):
+    """Тест: видалення контакту скидає кеш першої сторінки."""
+    service.repository.remove_contact.return_value = contact
+
+    await service.remove_contact(1, user)
+
+    cache.delete.assert_awaited_once_with(page0_cache_key(user))
@@ -0,0 +1,120 @@
+import asyncio
+from email.message import EmailMessage
+from unittest.mock import AsyncMock, MagicMock
+
+import aiosmtplib
+import pytest
+
+from src.services import email as email_service
+
+
+def make_smtp():
+    """Створює мок-об'єкт з'єднання aiosmtplib.SMTP."""
+    smtp = MagicMock()
+    smtp.is_connected = True
+    smtp.connect = AsyncMock()
+    smtp.login = AsyncMock()
+    smtp.send_message = AsyncMock()
+    return smtp
+
+
+def make_message(recipient):
+    """Створює простий лист для черги."""
+    message = EmailMessage()
+    message["To"] = recipient
+    message.set_content("test")
+    return message
+
+
+@pytest.fixture
+def queue(monkeypatch):
+    """Фікстура для окремої черги листів."""
+    queue = asyncio.Queue()
+    monkeypatch.setattr(email_service, "email_queue", queue)
+    return queue
+
+
+async def run_worker(queue):
+    """Запускає воркер, чекає обробки черги та зупиняє його."""
+    worker = asyncio.create_task(email_service.email_worker(queue))
+    await asyncio.wait_for(queue.join(), timeout=1)
+    worker.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await worker
+
+
+def test_send_email_queues_message(queue):
+    """Тест: лист підтвердження потрапляє в чергу з правильною адресою."""
+    email_service.send_email("user@example.com", "user", "http://testserver/")
+
+    message = queue.get_nowait()
+    assert isinstance(message, EmailMessage)
+    assert message["To"] == "user@example.com"
+    assert message["Subject"] == "Confirm your email"
+    assert "http://testserver/api/auth/confirmed_email/" in message.get_content()
+
+
+def test_send_reset_password_email_queues_message(queue):
+    """Тест: лист скидання пароля потрапляє в чергу з посиланням."""
+    email_service.send_reset_password_email(
+        "user@example.com", "user", "http://testserver/", "token123"
+    )
+
+    message = queue.get_nowait()
+    assert isinstance(message, EmailMessage)
+    assert message["To"] == "user@example.com"
+    assert "http://testserver/auth/reset-password/token123" in message.get_content()
+
+
+@pytest.mark.asyncio
+async def test_email_worker_reuses_connection(monkeypatch):
+    """Тест: воркер надсилає кілька листів через одне з'єднання."""
+    smtp = make_smtp()
+    smtp_factory = MagicMock(return_value=smtp)
+    monkeypatch.setattr(email_service.aiosmtplib, "SMTP", smtp_factory)
+
+    queue = asyncio.Queue()
+    for i in range(3):
+        queue.put_nowait(make_message(f"user{i}@example.com"))
+
+    await run_worker(queue)
+
+    smtp_factory.assert_called_once()
+    smtp.connect.assert_awaited_once()
+    assert smtp.send_message.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_email_worker_reconnects_after_disconnect(monkeypatch):
+    """Тест: після розриву з'єднання воркер перепідключається і повторює лист."""
+    broken, fresh = make_smtp(), make_smtp()
+    broken.send_message.side_effect = aiosmtplib.SMTPServerDisconnected("gone")
+    smtp_factory = MagicMock(side_effect=[broken, fresh])
+    monkeypatch.setattr(email_service.aiosmtplib, "SMTP", smtp_factory)
+
+    queue = asyncio.Queue()
+    queue.put_nowait(make_message("user@example.com"))
+
+    await run_worker(queue)
+
+    assert smtp_factory.call_count == 2
+    broken.close.assert_called_once()
+    fresh.send_message.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_email_worker_survives_unexpected_error(monkeypatch):
+    """Тест: неочікувана помилка не зупиняє воркер."""
+    failing, working = make_smtp(), make_smtp()
+    failing.connect.side_effect = ValueError("bad TLS settings")
+    smtp_factory = MagicMock(side_effect=[failing, working])
+    monkeypatch.setattr(email_service.aiosmtplib, "SMTP", smtp_factory)
+
+    queue = asyncio.Queue()
+    queue.put_nowait(make_message("first@example.com"))
+    queue.put_nowait(make_message("second@example.com"))
+
+    await run_worker(queue)
+
+    working.send_message.assert_awaited_once()
+    assert working.send_message.await_args.args[0]["To"] == "second@example.com"
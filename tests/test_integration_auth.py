@@ -35,6 +35,17 @@ async def test_repeat_signup(client, monkeypatch):
     assert data["detail"] == "A user with this email already exists."
 
 
+def test_repeat_signup_username(client, monkeypatch):
+    mock_send_email = Mock()
+    monkeypatch.setattr("src.api.auth.send_email", mock_send_email)
+    response = client.post("api/auth/register",
+                           json={**user_data, "email": "agent008@gmail.com"})
+    assert response.status_code == status.HTTP_409_CONFLICT, response.text
+    data = response.json()
+    assert data["detail"] == "A user with this username already exists."
+    mock_send_email.assert_not_called()
+
+
 def test_not_confirmed_login(client):
     response = client.post("api/auth/login",
                            json={"email": user_data.get("email"),
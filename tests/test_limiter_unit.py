@@ -0,0 +1,91 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from fastapi import HTTPException
+
+from src.services.limiter import RateLimiter, TOKEN_BUCKET_SCRIPT
+
+
+@pytest.fixture
+def request_mock():
+    """Фікстура для мок-об'єкта запиту."""
+    request = MagicMock()
+    request.client.host = "127.0.0.1"
+    request.url.path = "/api/auth/login"
+    return request
+
+
+@pytest.fixture
+def bucket(monkeypatch):
+    """Фікстура для мок-скрипта token bucket з місткістю у 2 токени."""
+    tokens = {"left": 2}
+
+    async def consume(keys, args):
+        if tokens["left"] > 0:
+            tokens["left"] -= 1
+            return 1
+        return 0
+
+    script = AsyncMock(side_effect=consume)
+    redis_mock = MagicMock()
+    redis_mock.redis.register_script.return_value = script
+    monkeypatch.setattr("src.services.limiter.redis_cache", redis_mock)
+    monkeypatch.setattr(RateLimiter, "_script", None)
+    return redis_mock, script
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_allows_then_rejects(bucket, request_mock):
+    """Тест: перші `times` запитів дозволені, наступний отримує 429."""
+    redis_mock, script = bucket
+    limiter = RateLimiter(times=2, seconds=60)
+
+    await limiter(request_mock)
+    await limiter(request_mock)
+    with pytest.raises(HTTPException) as exc:
+        await limiter(request_mock)
+
+    assert exc.value.status_code == 429
+    redis_mock.redis.register_script.assert_called_once_with(TOKEN_BUCKET_SCRIPT)
+    assert script.await_args.kwargs == {
+        "keys": ["rate_limit:/api/auth/login:127.0.0.1"],
+        "args": [2, 2 / 60],
+    }
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_passes_without_redis(monkeypatch, request_mock):
+    """Тест: без підключення до Redis запити не обмежуються."""
+    redis_mock = MagicMock()
+    redis_mock.redis = None
+    monkeypatch.setattr("src.services.limiter.redis_cache", redis_mock)
+    limiter = RateLimiter(times=1, seconds=60)
+
+    for _ in range(5):
+        await limiter(request_mock)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_script_empties_and_refills(monkeypatch, request_mock):
+    """Тест: Lua-скрипт вичерпує кошик і поповнює його з часом."""
+    redis_mock = MagicMock()
+    redis_mock.redis = FakeAsyncRedis()
+    monkeypatch.setattr("src.services.limiter.redis_cache", redis_mock)
+    monkeypatch.setattr(RateLimiter, "_script", None)
+    limiter = RateLimiter(times=2, seconds=1)
+
+    await limiter(request_mock)
+    await limiter(request_mock)
+    with pytest.raises(HTTPException) as exc:
+        await limiter(request_mock)
+    assert exc.value.status_code == 429
+
+    # 2 токени за секунду: через 0.6 с з'являється один токен
+    await asyncio.sleep(0.6)
+    await limiter(request_mock)
+    with pytest.raises(HTTPException):
+        await limiter(request_mock)
+
+    await redis_mock.redis.aclose()
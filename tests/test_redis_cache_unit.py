@@ -0,0 +1,82 @@
+import json
+
+import pytest
+import pytest_asyncio
+from fakeredis import FakeAsyncRedis
+
+from src.services.redis_cache import CACHE_KEY_PREFIX, RedisCache
+
+
+@pytest_asyncio.fixture
+async def cache():
+    """Фікстура для кешу поверх in-memory Redis."""
+    cache = RedisCache()
+    cache.redis = FakeAsyncRedis()
+    yield cache
+    await cache.redis.aclose()
+
+
+@pytest.mark.asyncio
+async def test_set_get_round_trip(cache):
+    """Тест: значення, збережене через set, читається через get."""
+    value = {"id": 1, "username": "testuser", "is_verified": True}
+
+    await cache.set("user:testuser", value, expire=60)
+
+    assert await cache.get("user:testuser") == value
+    assert await cache.redis.ttl(f"{CACHE_KEY_PREFIX}user:testuser") > 0
+
+
+@pytest.mark.asyncio
+async def test_hset_hget_round_trip(cache):
+    """Тест: значення поля хешу зберігається та читається."""
+    value = [{"id": 1, "name": "John"}]
+
+    await cache.hset("contacts:page0:1", "10", value, expire=60)
+
+    assert await cache.hget("contacts:page0:1", "10") == value
+    assert await cache.hget("contacts:page0:1", "20") is None
+    assert await cache.redis.ttl(f"{CACHE_KEY_PREFIX}contacts:page0:1") > 0
+
+
+@pytest.mark.asyncio
+async def test_delete(cache):
+    """Тест: delete видаляє значення."""
+    await cache.set("user:testuser", {"id": 1})
+    await cache.delete("user:testuser")
+
+    assert await cache.get("user:testuser") is None
+
+
+@pytest.mark.asyncio
+async def test_keys_are_versioned(cache):
+    """Тест: нові записи не перезаписують ключі старого формату."""
+    await cache.redis.set("user:testuser", json.dumps({"id": 1}))
+
+    await cache.set("user:testuser", {"id": 2})
+
+    assert json.loads(await cache.redis.get("user:testuser")) == {"id": 1}
+    assert await cache.get("user:testuser") == {"id": 2}
+
+
+@pytest.mark.asyncio
+async def test_get_reads_json_dumps_value(cache):
+    """Тест: значення у форматі json.dumps декодується."""
+    await cache.redis.set(
+        f"{CACHE_KEY_PREFIX}user:testuser", json.dumps({"id": 1, "role": "admin"})
+    )
+
+    assert await cache.get("user:testuser") == {"id": 1, "role": "admin"}
+
+
+@pytest.mark.asyncio
+async def test_no_connection_is_noop():
+    """Тест: без підключення операції нічого не роблять."""
+    cache = RedisCache()
+
+    await cache.set("user:testuser", {"id": 1})
+    await cache.hset("contacts:page0:1", "10", [])
+    await cache.delete("user:testuser")
+
+    assert await cache.get("user:testuser") is None
+    assert await cache.hget("contacts:page0:1", "10") is None
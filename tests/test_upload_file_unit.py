@@ -0,0 +1,23 @@
+from unittest.mock import MagicMock
+
+from src.services import upload_file as upload_service
+
+
+def test_upload_file_uploads_image_and_returns_avatar_url(monkeypatch):
+    """Тест: аватар завантажується як image, URL містить трансформацію та версію."""
+    upload_large = MagicMock(return_value={"version": 1712345678})
+    monkeypatch.setattr(upload_service.cloudinary.uploader, "upload_large", upload_large)
+    file = MagicMock()
+
+    url = upload_service.upload_file(file, "testuser")
+
+    upload_large.assert_called_once_with(
+        file.file,
+        resource_type="image",
+        chunk_size=upload_service.UPLOAD_CHUNK_SIZE,
+        public_id="RestApp/testuser",
+        overwrite=True,
+    )
+    assert "/image/upload/c_fill,h_250,w_250/RestApp/testuser" in url
+    assert url.endswith("?v=1712345678")
+    assert url == f"{upload_service.avatar_base_url('RestApp/testuser')}?v=1712345678"
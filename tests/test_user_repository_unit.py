@@ -102,13 +102,16 @@ async def test_create_user(user_repository, mock_session):
 
 
 @pytest.mark.asyncio
-async def test_confirmed_email(user_repository, mock_session, test_user):
-    """Тест підтвердження електронної пошти користувача."""
-    user_repository.get_user_by_email = AsyncMock(return_value=test_user)
+async def test_mark_verified(user_repository, mock_session):
+    """Тест підтвердження email одним UPDATE-запитом."""
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = "testuser"
+    mock_session.execute = AsyncMock(return_value=mock_result)
 
-    await user_repository.confirmed_email(email="testuser@example.com")
+    username = await user_repository.mark_verified(email="testuser@example.com")
 
-    assert test_user.is_verified is True
+    assert username == "testuser"
+    mock_session.execute.assert_awaited_once()
     mock_session.commit.assert_awaited_once()
 
 
@@ -142,3 +145,18 @@ async def test_reset_password(user_repository, mock_session, test_user):
 
     mock_session.commit.assert_awaited_once()
     mock_session.refresh.assert_awaited_once_with(test_user)
+
+
+@pytest.mark.asyncio
+async def test_get_existing_identifiers(user_repository, mock_session):
+    """Тест пошуку зайнятих email та username одним запитом."""
+    mock_result = MagicMock()
+    mock_result.all.return_value = [("testuser@example.com", "testuser")]
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    existing = await user_repository.get_existing_identifiers(
+        email="testuser@example.com", username="otheruser"
+    )
+
+    assert existing == [("testuser@example.com", "testuser")]
+    mock_session.execute.assert_awaited_once()